@@ -19,6 +19,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+_WORLD_PATH_RE = re.compile(r'^([\w-]+)/((\d{8})_(\d{6})_(world|lore|code)_([\w-]+))\.md$')
+_SLUG_WORD_RE = re.compile(r'[a-z]+')
+
 
 def fetch_worlds(token: str | None = None) -> list[dict]:
     """Fetch world artifacts from GitHub API."""
@@ -38,10 +41,9 @@ def fetch_worlds(token: str | None = None) -> list[dict]:
         print(f"[warn] GitHub fetch failed: {e}", file=sys.stderr)
         return []
     
-    pattern = re.compile(r'^([\w-]+)/((\d{8})_(\d{6})_(world|lore|code)_([\w-]+))\.md$')
     worlds = []
     for item in data.get("tree", []):
-        m = pattern.match(item.get("path", ""))
+        m = _WORLD_PATH_RE.match(item.get("path", ""))
         if m:
             dir_, filename, date, time_, type_, slug = m.groups()
             node = "aria64" if dir_ == "worlds" else dir_.replace("-worlds", "")
@@ -67,8 +69,7 @@ def analyze(worlds: list[dict]) -> dict:
     # Word frequency across slugs
     all_words = []
     for w in worlds:
-        words = re.findall(r'[a-z]+', w["slug"].lower())
-        all_words.extend(words)
+        all_words.extend(_SLUG_WORD_RE.findall(w["slug"].lower()))
     top_words = Counter(all_words).most_common(20)
     
     # Generation rate (worlds per hour by day)
@@ -3,85 +3,190 @@
 Experiment 005: Agent Memory Pattern Analysis
 BlackRoad Labs Research — Analyzes world artifact patterns and agent memory structure
 
-Dependencies: httpx, collections (stdlib)
+Dependencies: httpx (brotli optional), numpy, orjson, collections (stdlib)
 """
 
-import httpx, json, re
-from collections import Counter, defaultdict
+import asyncio, httpx, re, string
+import numpy as np
+import orjson
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import combinations, islice
 from datetime import datetime
+from typing import Iterator
 
 WORLDS_API = "https://worlds.blackroad.io/"
 DASHBOARD_API = "https://dashboard-api.blackroad.io/"
 
+_WORD_RE = re.compile(r"\w+")
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation if c != "_"})
+UNICODE_TOKENS = False  # True: split on \w+ so non-ASCII punctuation also breaks tokens
+STOPWORDS = frozenset({"a", "the", "of", "in", "to", "and", "is", "that"})
+
 # ── Fetch Data ──────────────────────────────────────────────────────────────
 
-def fetch_worlds(limit=100):
-    r = httpx.get(f"{WORLDS_API}?limit={limit}", timeout=15)
+async def fetch_worlds(client, limit=100):
+    r = await client.get(f"{WORLDS_API}?limit={limit}")
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
-def fetch_dashboard():
-    r = httpx.get(DASHBOARD_API, timeout=15)
+async def fetch_dashboard(client):
+    r = await client.get(DASHBOARD_API)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
+
+async def fetch_all(limit=100):
+    """Fetch worlds and dashboard concurrently; dashboard is None if it failed"""
+    limits = httpx.Limits(max_keepalive_connections=10)
+    async with httpx.AsyncClient(timeout=15, limits=limits) as client:
+        data, dashboard = await asyncio.gather(
+            fetch_worlds(client, limit), fetch_dashboard(client), return_exceptions=True
+        )
+    if isinstance(data, BaseException):
+        raise data
+    return data, None if isinstance(dashboard, BaseException) else dashboard
+
+# ── Normalization ───────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class World:
+    """A world artifact reduced to the fields the analyses read"""
+    node: str
+    type: str
+    title: str
+    hour: int
+
+def normalize(worlds: list[dict]) -> list[World]:
+    """Convert raw API dicts into World records"""
+    return [World(w["node"], w["type"], w["title"], int(w["timestamp"][11:13])) for w in worlds]
 
 # ── Analysis Functions ───────────────────────────────────────────────────────
 
-def analyze_temporal_patterns(worlds):
+def analyze_temporal_patterns(worlds: list[World]) -> dict[int, int]:
     """Find hourly generation rates"""
-    hour_counts = Counter()
-    for w in worlds:
-        hour = w["timestamp"][11:13]
-        hour_counts[hour] += 1
-    return dict(sorted(hour_counts.items()))
+    return dict(sorted(Counter(w.hour for w in worlds).items()))
 
-def analyze_type_distribution(worlds):
+def analyze_type_distribution(worlds: list[World]) -> Counter[str]:
     """World/lore/code type ratios"""
-    return dict(Counter(w["type"] for w in worlds))
+    return Counter(w.type for w in worlds)
 
-def analyze_node_productivity(worlds):
+def analyze_node_productivity(worlds: list[World]) -> dict[str, dict[str, int]]:
     """Per-node generation rates"""
-    node_type = defaultdict(lambda: Counter())
-    for w in worlds:
-        node_type[w["node"]][w["type"]] += 1
-    return {node: dict(counts) for node, counts in node_type.items()}
+    return _pivot_node_types(Counter((w.node, w.type) for w in worlds))
 
-def compute_entropy(counts):
-    """Shannon entropy of distribution"""
-    import math
-    total = sum(counts.values())
-    return -sum((c/total) * math.log2(c/total) for c in counts.values() if c > 0)
+def _pivot_node_types(pairs: Counter[tuple[str, str]]) -> dict[str, dict[str, int]]:
+    node_type: dict[str, dict[str, int]] = {}
+    for (node, type_), n in pairs.items():
+        node_type.setdefault(node, {})[type_] = n
+    return node_type
 
-def extract_vocabulary(worlds):
+def compute_entropy(counts: dict) -> float:
+    """Shannon entropy of distribution"""
+    v = np.fromiter(counts.values(), dtype=np.float64)
+    p = v[v > 0] / v.sum()
+    return float(-(p * np.log2(p)).sum())
+
+def _tokenize(text: str) -> list[str]:
+    if UNICODE_TOKENS:
+        return _WORD_RE.findall(text)
+    return text.translate(_PUNCT_TABLE).split()
+
+def _vocab_tokens(title: str, _is_stop=STOPWORDS.__contains__) -> Iterator[str]:
+    return (t for t in _tokenize(title.lower()) if len(t) > 2 and not _is_stop(t))
+
+def _graph_tokens(title: str) -> set[str]:
+    return {t for t in _tokenize(title.lower()) if len(t) > 3}
+
+@dataclass(slots=True)
+class _Edges:
+    """Co-occurrence edges over interned token ids, one entry per pair"""
+    ids: dict[str, int] = field(default_factory=dict)
+    rows: list[int] = field(default_factory=list)
+    cols: list[int] = field(default_factory=list)
+
+def _link(edges: _Edges, tokens: set[str]) -> None:
+    ids = edges.ids
+    token_ids = [ids.setdefault(t, len(ids)) for t in tokens]
+    for a, b in combinations(token_ids, 2):
+        edges.rows.append(a)
+        edges.cols.append(b)
+
+def _adjacency(edges: _Edges) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetrize edges into CSR form: (indptr, neighbour ids)"""
+    n = len(edges.ids)
+    src = np.array(edges.rows + edges.cols, dtype=np.int64)
+    dst = np.array(edges.cols + edges.rows, dtype=np.int64)
+    src, dst = np.divmod(np.unique(src * n + dst), n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst
+
+def _prune(edges: _Edges) -> dict[str, list[str]]:
+    indptr, dst = _adjacency(edges)
+    names = list(edges.ids)
+    bounds = indptr.tolist()
+    neighbours = dst.tolist()
+    return {
+        names[i]: [names[j] for j in neighbours[bounds[i]:bounds[i + 1]]]
+        for i in np.flatnonzero(np.diff(indptr) >= 2).tolist()
+    }
+
+def extract_vocabulary(worlds: list[World]) -> list[tuple[str, int]]:
     """Most frequent words in world titles"""
-    words = []
+    vocab: Counter[str] = Counter()
+    update = vocab.update
     for w in worlds:
-        words.extend(re.findall(rw+, w["title"].lower()))
-    stopwords = {"a", "the", "of", "in", "to", "and", "is", "that"}
-    filtered = [w for w in words if w not in stopwords and len(w) > 2]
-    return Counter(filtered).most_common(20)
+        update(_vocab_tokens(w.title))
+    return vocab.most_common(20)
 
-def knowledge_graph(worlds):
+def knowledge_graph(worlds: list[World]) -> dict[str, list[str]]:
     """Build simple co-occurrence graph from titles"""
-    graph = defaultdict(set)
+    edges = _Edges()
+    for w in worlds:
+        _link(edges, _graph_tokens(w.title))
+    return _prune(edges)
+
+@dataclass
+class Analyses:
+    """Results of every per-world analysis, gathered in one scan"""
+    hourly: dict[int, int] = field(default_factory=dict)
+    types: Counter[str] = field(default_factory=Counter)
+    node_productivity: dict[str, dict[str, int]] = field(default_factory=dict)
+    vocabulary: list[tuple[str, int]] = field(default_factory=list)
+    knowledge_graph: dict[str, list[str]] = field(default_factory=dict)
+
+def analyze_all(worlds: list[World]) -> Analyses:
+    """Run all analyses in a single pass over worlds"""
+    hour_counts: Counter[int] = Counter()
+    type_counts: Counter[str] = Counter()
+    node_types: Counter[tuple[str, str]] = Counter()
+    vocab: Counter[str] = Counter()
+    update_vocab = vocab.update
+    edges = _Edges()
     for w in worlds:
-        tokens = [t.lower() for t in re.findall(r"\w+", w["title"]) if len(t) > 3]
-        for i, t1 in enumerate(tokens):
-            for t2 in tokens[i+1:]:
-                graph[t1].add(t2)
-                graph[t2].add(t1)
-    return {k: list(v) for k, v in graph.items() if len(v) >= 2}
+        type_ = w.type
+        hour_counts[w.hour] += 1
+        type_counts[type_] += 1
+        node_types[(w.node, type_)] += 1
+        title = w.title
+        update_vocab(_vocab_tokens(title))
+        _link(edges, _graph_tokens(title))
+
+    return Analyses(
+        hourly=dict(sorted(hour_counts.items())),
+        types=type_counts,
+        node_productivity=_pivot_node_types(node_types),
+        vocabulary=vocab.most_common(20),
+        knowledge_graph=_prune(edges),
+    )
 
 # ── Report ────────────────────────────────────────────────────────────────
 
 def bar_chart(data, width=40):
     if not data: return ""
-    max_val = max(data.values())
-    lines = []
-    for k, v in sorted(data.items(), key=lambda x: -x[1]):
-        bar_len = int(v / max_val * width) if max_val > 0 else 0
-        lines.append(f"  {k:<15} {█ * bar_len} {v}")
-    return "\n".join(lines)
+    items = sorted(data.items(), key=lambda x: -x[1])
+    scale = width / (items[0][1] or 1)
+    return "\n".join(f"  {k:<15} {'█' * int(v * scale)} {v}" for k, v in items)
 
 def run():
     print("=" * 60)
@@ -89,13 +194,17 @@ def run():
     print(f"Timestamp: {datetime.utcnow().isoformat()}Z")
     print("=" * 60)
 
-    data = fetch_worlds(100)
-    worlds = data["worlds"]
+    data, dashboard = asyncio.run(fetch_all(100))
+    worlds = normalize(data["worlds"])
     total = data["total"]
-    print(f"\nDataset: {total} total world artifacts ({len(worlds)} analyzed)\n")
+    print(f"\nDataset: {total} total world artifacts ({len(worlds)} analyzed)")
+    if dashboard is not None:
+        print(f"Dashboard: {len(dashboard)} fields")
+    print()
+    results = analyze_all(worlds)
 
     # Type distribution
-    types = analyze_type_distribution(worlds)
+    types = results.types
     type_entropy = compute_entropy(types)
     print("── Type Distribution ──────────────────────────────────")
     print(bar_chart(types))
@@ -103,27 +212,23 @@ def run():
 
     # Node productivity
     print("\n── Node Productivity ──────────────────────────────────")
-    node_prod = analyze_node_productivity(worlds)
-    for node, counts in node_prod.items():
+    for node, counts in results.node_productivity.items():
         total_node = sum(counts.values())
         print(f"  {node}: {total_node} artifacts — {counts}")
 
     # Temporal patterns
     print("\n── Hourly Generation Pattern ──────────────────────────")
-    hourly = analyze_temporal_patterns(worlds)
-    print(bar_chart(hourly, width=20))
+    print(bar_chart({f"{h:02d}": n for h, n in results.hourly.items()}, width=20))
 
     # Vocabulary
     print("\n── Memory Vocabulary (top 20 tokens) ─────────────────")
-    vocab = extract_vocabulary(worlds)
-    for word, count in vocab[:10]:
+    for word, count in results.vocabulary[:10]:
         print(f"  {word:<20} {count}")
 
     # Knowledge graph
     print("\n── Knowledge Graph (co-occurrences) ───────────────────")
-    kg = knowledge_graph(worlds)
-    for k, v in list(kg.items())[:10]:
-        print(f"  {k} → {", ".join(list(v)[:5])}")
+    for k, v in islice(results.knowledge_graph.items(), 10):
+        print(f"  {k} → {', '.join(v[:5])}")
 
     print("\n✅ Experiment 005 complete")
 
@@ -20,19 +20,93 @@ import re
 import sqlite3
 import sys
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:  # orjson is optional; it is several times faster than the stdlib codec
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _HAVE_ORJSON = False
+
+
+def _dumps(value: Any) -> str:
+    if _HAVE_ORJSON:
+        # OPT_NON_STR_KEYS: accept int/float/bool keys like json.dumps does.
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if _HAVE_ORJSON else json.loads(data)
+
 
 DB_PATH = Path.home() / ".blackroad" / "labs-research.db"
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Paper authors/tags are stored as plain text joined on the ASCII unit
+# separator; tags are also normalized into paper_tags for indexed lookup.
+_LIST_SEP = "\x1f"
+
+SCHEMA_VERSION = 1
+
+# Hot-path statements, kept as single shared strings: sqlite3 caches the
+# prepared statement per connection keyed on the exact SQL text.
+# Paper and tag inserts are multi-row: _insert_rows appends the VALUES
+# list, and every full chunk produces the same text, so still one plan.
+_SQL_INSERT_PAPER = """
+    INSERT OR IGNORE INTO papers
+        (id, title, abstract, authors, tags, status,
+         score, created_at, updated_at, metadata)
+"""
+_SQL_INSERT_TAG = "INSERT OR IGNORE INTO paper_tags (paper_id, tag)"
+# Bound-parameter budget per statement: SQLite's compiled-in default
+# before 3.32, and so safe on every build.
+_MAX_VARS = 999
+_SQL_INSERT_HYPOTHESIS = """
+    INSERT INTO hypotheses (id, paper_id, text, status, confidence,
+                            evidence, created_at, updated_at)
+    VALUES (?, ?, ?, 'proposed', ?, ?, ?, ?)
+"""
+_SQL_INSERT_CITATION = """
+    INSERT INTO citations (paper_id, ref_id, title, authors, year, url, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_SCORE  = "UPDATE papers SET score=?, updated_at=? WHERE id=?"
+_SQL_UPDATE_STATUS = "UPDATE papers SET status=?, updated_at=? WHERE id=?"
+# Unset fields are bound as NULL so every partial update shares one plan.
+_SQL_UPDATE_HYPOTHESIS = """
+    UPDATE hypotheses
+    SET status     = COALESCE(?, status),
+        confidence = COALESCE(?, confidence),
+        evidence   = COALESCE(?, evidence),
+        updated_at = ?
+    WHERE id = ?
+"""
+
+# Columns read by _row_to_summary; listing queries select only these so
+# abstracts and metadata are never pulled off disk for a summary.
+_SUMMARY_COLS = "id, title, status, score, authors, tags, created_at"
+
+# Applied on connection open when ``fast`` is set (the default): WAL lets
+# readers run alongside the writer and makes synchronous=NORMAL durable
+# enough for a local corpus. foreign_keys and mmap_size are always applied.
+_FAST_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Data models
 # ──────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Hypothesis:
     """A testable hypothesis with confidence tracking."""
     id:         str
@@ -47,10 +121,12 @@ class Hypothesis:
         return self.status in ("proposed", "testing")
 
     def update_confidence(self, delta: float) -> None:
-        self.confidence = max(0.0, min(1.0, self.confidence + delta))
+        c = self.confidence + delta
+        # "c <= 1.0" rather than "c > 1.0" so NaN clamps to 1.0, as min/max did.
+        self.confidence = 0.0 if c < 0.0 else c if c <= 1.0 else 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """A single citation or reference."""
     ref_id:    str
@@ -61,8 +137,23 @@ class Citation:
     notes:     str            = ""
 
 
-@dataclass
-class ResearchPaper:
+_TextKey = Tuple[str, str, Tuple[str, ...]]
+
+
+class _TextCached:
+    """
+    Holds ResearchPaper's derived-text cache in a slot of its own, so the
+    cache stays out of the dataclass fields (asdict, astuple, repr, eq).
+    """
+    __slots__ = ("_cache",)
+
+    # (title, abstract, tags) the cache was built from, the lowercased
+    # haystack, and the abstract word count; rebuilt when the key changes.
+    _cache: Tuple[_TextKey, str, int]
+
+
+@dataclass(slots=True)
+class ResearchPaper(_TextCached):
     """
     A structured research paper or experiment report entry.
 
@@ -94,7 +185,7 @@ class ResearchPaper:
     metadata:    Dict[str, Any]        = field(default_factory=dict)
 
     def word_count(self) -> int:
-        return len(self.abstract.split())
+        return self._text_cache()[2]
 
     def confirmed_hypotheses(self) -> List[Hypothesis]:
         return [h for h in self.hypotheses if h.status == "confirmed"]
@@ -103,11 +194,27 @@ class ResearchPaper:
         active = [h.confidence for h in self.hypotheses if h.is_active()]
         return sum(active) / len(active) if active else None
 
+    def _text_cache(self) -> Tuple[_TextKey, str, int]:
+        key   = (self.title, self.abstract, tuple(self.tags))
+        cache = getattr(self, "_cache", None)
+        if cache is None or cache[0] != key:
+            cache = (
+                key,
+                " ".join((self.title, self.abstract, *self.tags)).lower(),
+                len(self.abstract.split()),
+            )
+            # The slot is inherited from _TextCached, which mypy does not see.
+            object.__setattr__(self, "_cache", cache)
+        return cache
+
     def matches_query(self, query: str) -> bool:
         """Case-insensitive search across title, abstract, and tags."""
-        q   = query.lower()
-        hay = " ".join([self.title, self.abstract] + self.tags).lower()
-        return q in hay
+        return query.lower() in self._text_cache()[1]
+
+    def matches_any(self, queries: List[str]) -> bool:
+        """True if any of the (already lowercased) queries matches."""
+        hay = self._text_cache()[1]
+        return any(q in hay for q in queries)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -128,58 +235,220 @@ class ResearchAnalyzer:
         ra.update_score(pid, 8.5)
         results = ra.search("emergence")
         stats   = ra.corpus_stats()
+
+    A single connection is held open for the analyzer's lifetime; call
+    ``close()`` or use the analyzer as a context manager to release it.
+    Pass ``fast=False`` to keep SQLite's default journal and sync settings,
+    and ``mmap_bytes`` to size the read-only memory map (0 disables it).
     """
 
-    def __init__(self, db_path: Optional[Path] = None) -> None:
-        self.db_path = db_path or DB_PATH
+    VALID_STATUSES = frozenset(("draft", "review", "published", "archived"))
+
+    def __init__(
+        self,
+        db_path:    Optional[Path] = None,
+        fast:       bool           = True,
+        mmap_bytes: int            = 256 << 20,
+    ) -> None:
+        self.db_path    = db_path or DB_PATH
+        self.fast       = fast
+        self.mmap_bytes = mmap_bytes
         self._init_db()
 
+    def close(self) -> None:
+        """Close the underlying SQLite connection (safe to call twice)."""
+        con = getattr(self, "_con", None)
+        if con is not None:
+            con.close()
+
+    def __enter__(self) -> "ResearchAnalyzer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Run a block of writes as one transaction.
+
+        ``add_*`` / ``update_*`` calls inside the block join it instead of
+        committing individually; if the block raises, all of it is rolled
+        back. A ``bulk()`` opened inside another transaction runs as a
+        savepoint, so its failure only undoes its own writes.
+        """
+        if not self._con.in_transaction:
+            with self._tx():
+                yield
+            return
+        self._con.execute("SAVEPOINT bulk")
+        try:
+            yield
+        except BaseException:
+            self._con.execute("ROLLBACK TO bulk")
+            self._con.execute("RELEASE bulk")
+            raise
+        self._con.execute("RELEASE bulk")
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        """
+        Wrap a unit of work in BEGIN ... COMMIT, rolling back on error.
+
+        The connection runs in autocommit mode (``isolation_level=None``),
+        so this is the only place transactions start; inside an enclosing
+        ``bulk()`` it simply joins the open transaction.
+        """
+        con = self._con
+        if con.in_transaction:
+            yield con
+            return
+        con.execute("BEGIN")
+        try:
+            yield con
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+
     # ── DB bootstrap ──────────────────────────────────────────────────────────
 
     def _init_db(self) -> None:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as con:
-            con.executescript("""
-                CREATE TABLE IF NOT EXISTS papers (
-                    id          TEXT PRIMARY KEY,
-                    title       TEXT NOT NULL,
-                    abstract    TEXT NOT NULL DEFAULT '',
-                    authors     TEXT NOT NULL DEFAULT '[]',
-                    tags        TEXT NOT NULL DEFAULT '[]',
-                    status      TEXT NOT NULL DEFAULT 'draft',
-                    score       REAL NOT NULL DEFAULT 0.0,
-                    created_at  TEXT NOT NULL,
-                    updated_at  TEXT NOT NULL,
-                    metadata    TEXT NOT NULL DEFAULT '{}'
-                );
-                CREATE TABLE IF NOT EXISTS hypotheses (
-                    id          TEXT PRIMARY KEY,
-                    paper_id    TEXT NOT NULL REFERENCES papers(id),
-                    text        TEXT NOT NULL,
-                    status      TEXT NOT NULL DEFAULT 'proposed',
-                    confidence  REAL NOT NULL DEFAULT 0.5,
-                    evidence    TEXT NOT NULL DEFAULT '[]',
-                    created_at  TEXT NOT NULL,
-                    updated_at  TEXT NOT NULL
-                );
-                CREATE TABLE IF NOT EXISTS citations (
-                    id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                    paper_id    TEXT NOT NULL REFERENCES papers(id),
-                    ref_id      TEXT NOT NULL,
-                    title       TEXT NOT NULL,
-                    authors     TEXT NOT NULL DEFAULT '[]',
-                    year        INTEGER,
-                    url         TEXT NOT NULL DEFAULT '',
-                    notes       TEXT NOT NULL DEFAULT ''
-                );
-                CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts
-                    USING fts5(id UNINDEXED, title, abstract, tags,
-                               content='papers', content_rowid='rowid');
-                CREATE INDEX IF NOT EXISTS idx_papers_status ON papers(status);
-                CREATE INDEX IF NOT EXISTS idx_papers_score  ON papers(score);
-                CREATE INDEX IF NOT EXISTS idx_hyp_paper     ON hypotheses(paper_id);
-                CREATE INDEX IF NOT EXISTS idx_hyp_status    ON hypotheses(status);
-            """)
+        # Autocommit mode: transactions are opened only by _tx() / bulk().
+        con = self._con = sqlite3.connect(self.db_path, isolation_level=None)
+        con.row_factory = sqlite3.Row
+        con.execute("PRAGMA foreign_keys=ON")
+        con.execute(f"PRAGMA mmap_size={int(self.mmap_bytes)}")
+        if self.fast:
+            for pragma in _FAST_PRAGMAS:
+                con.execute(f"PRAGMA {pragma}")
+        fts = con.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'papers_fts'"
+        ).fetchone()
+        rebuild_fts = fts is None or "trigram" not in fts[0]
+        if fts is not None and rebuild_fts:
+            con.execute("DROP TABLE papers_fts")
+        version = con.execute("PRAGMA user_version").fetchone()[0]
+        # Fresh planner statistics are needed whenever an index is new.
+        indexes_missing = con.execute(
+            """
+            SELECT 4 - COUNT(*) FROM sqlite_master
+            WHERE name IN ('idx_papers_status_score', 'idx_paper_tags_tag',
+                           'idx_hyp_paper_created', 'idx_cit_paper')
+            """
+        ).fetchone()[0]
+        con.executescript("""
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS papers (
+                id          TEXT PRIMARY KEY,
+                title       TEXT NOT NULL,
+                abstract    TEXT NOT NULL DEFAULT '',
+                authors     TEXT NOT NULL DEFAULT '',
+                tags        TEXT NOT NULL DEFAULT '',
+                status      TEXT NOT NULL DEFAULT 'draft',
+                score       REAL NOT NULL DEFAULT 0.0,
+                created_at  TEXT NOT NULL,
+                updated_at  TEXT NOT NULL,
+                metadata    TEXT NOT NULL DEFAULT '{}',
+                search_blob TEXT GENERATED ALWAYS AS (
+                    lower(title || char(31) || abstract || char(31) || tags)
+                ) VIRTUAL
+            );
+            CREATE TABLE IF NOT EXISTS paper_tags (
+                paper_id    TEXT NOT NULL REFERENCES papers(id),
+                tag         TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (paper_id, tag)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS hypotheses (
+                id          TEXT PRIMARY KEY,
+                paper_id    TEXT NOT NULL REFERENCES papers(id),
+                text        TEXT NOT NULL,
+                status      TEXT NOT NULL DEFAULT 'proposed',
+                confidence  REAL NOT NULL DEFAULT 0.5,
+                evidence    TEXT NOT NULL DEFAULT '[]',
+                created_at  TEXT NOT NULL,
+                updated_at  TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS citations (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                paper_id    TEXT NOT NULL REFERENCES papers(id),
+                ref_id      TEXT NOT NULL,
+                title       TEXT NOT NULL,
+                authors     TEXT NOT NULL DEFAULT '[]',
+                year        INTEGER,
+                url         TEXT NOT NULL DEFAULT '',
+                notes       TEXT NOT NULL DEFAULT ''
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts
+                USING fts5(title, abstract, tags,
+                           content='papers', content_rowid='rowid',
+                           tokenize='trigram');
+            CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+                INSERT INTO papers_fts(rowid, title, abstract, tags)
+                VALUES (new.rowid, new.title, new.abstract, new.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, abstract, tags)
+                VALUES ('delete', old.rowid, old.title, old.abstract, old.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS papers_fts_au
+            AFTER UPDATE OF title, abstract, tags ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, abstract, tags)
+                VALUES ('delete', old.rowid, old.title, old.abstract, old.tags);
+                INSERT INTO papers_fts(rowid, title, abstract, tags)
+                VALUES (new.rowid, new.title, new.abstract, new.tags);
+            END;
+            DROP INDEX IF EXISTS idx_papers_status;
+            CREATE INDEX IF NOT EXISTS idx_papers_status_score
+                ON papers(status, score DESC);
+            CREATE TRIGGER IF NOT EXISTS papers_cascade_bd BEFORE DELETE ON papers BEGIN
+                DELETE FROM hypotheses WHERE paper_id = old.id;
+                DELETE FROM citations  WHERE paper_id = old.id;
+                DELETE FROM paper_tags WHERE paper_id = old.id;
+            END;
+            CREATE INDEX IF NOT EXISTS idx_papers_score  ON papers(score);
+            CREATE INDEX IF NOT EXISTS idx_paper_tags_tag ON paper_tags(tag, paper_id);
+            DROP INDEX IF EXISTS idx_hyp_paper;
+            CREATE INDEX IF NOT EXISTS idx_hyp_paper_created
+                ON hypotheses(paper_id, created_at);
+            CREATE INDEX IF NOT EXISTS idx_cit_paper     ON citations(paper_id);
+            CREATE INDEX IF NOT EXISTS idx_hyp_status    ON hypotheses(status);
+            COMMIT;
+        """)
+        with self._tx():
+            # Index existing rows before any migration UPDATE fires the FTS
+            # triggers, whose 'delete' step assumes the old row is indexed.
+            if rebuild_fts:
+                con.execute("INSERT INTO papers_fts(papers_fts) VALUES ('rebuild')")
+            columns = {r["name"] for r in con.execute("PRAGMA table_xinfo(papers)")}
+            if "search_blob" not in columns:
+                con.execute(
+                    "ALTER TABLE papers ADD COLUMN search_blob TEXT GENERATED ALWAYS AS "
+                    "(lower(title || char(31) || abstract || char(31) || tags)) VIRTUAL"
+                )
+            if version < 1:
+                self._migrate_json_lists(con)
+            con.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            if indexes_missing:
+                con.execute("ANALYZE")
+
+    @staticmethod
+    def _migrate_json_lists(con: sqlite3.Connection) -> None:
+        """Convert pre-v1 JSON-encoded authors/tags and fill paper_tags."""
+        rows = con.execute("SELECT id, authors, tags FROM papers").fetchall()
+        lists = [(r["id"], _loads(r["authors"] or "[]"), _loads(r["tags"] or "[]"))
+                 for r in rows]
+        con.executemany(
+            "UPDATE papers SET authors=?, tags=? WHERE id=?",
+            [(_join(authors), _join(tags), pid) for pid, authors, tags in lists],
+        )
+        _insert_rows(
+            con, _SQL_INSERT_TAG, [(pid, t) for pid, _, tags in lists for t in tags if t]
+        )
 
     # ── Paper CRUD ────────────────────────────────────────────────────────────
 
@@ -190,6 +459,8 @@ class ResearchAnalyzer:
         authors:  Optional[List[str]]    = None,
         tags:     Optional[List[str]]    = None,
         metadata: Optional[Dict[str, Any]] = None,
+        status:   str                    = "draft",
+        score:    float                  = 0.0,
     ) -> str:
         """
         Add a new research paper to the corpus.
@@ -200,58 +471,137 @@ class ResearchAnalyzer:
             authors:  List of author name strings.
             tags:     Classification / keyword tags.
             metadata: Additional key-value metadata.
+            status:   Initial status (see ``update_status``).
+            score:    Initial relevance / quality score (0–10).
 
         Returns:
             Paper ID string.
         """
-        pid = _paper_id(title)
-        ts  = _now()
-        with sqlite3.connect(self.db_path) as con:
-            con.execute(
-                """
-                INSERT OR IGNORE INTO papers
-                    (id, title, abstract, authors, tags, status,
-                     score, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, 'draft', 0.0, ?, ?, ?)
-                """,
-                (pid, title, abstract,
-                 json.dumps(authors or []), json.dumps(tags or []),
-                 ts, ts, json.dumps(metadata or {})),
-            )
-            con.execute(
-                "INSERT OR IGNORE INTO papers_fts(id, title, abstract, tags) VALUES (?,?,?,?)",
-                (pid, title, abstract, " ".join(tags or [])),
-            )
-        return pid
+        return self.add_papers_bulk([{
+            "title": title, "abstract": abstract, "authors": authors,
+            "tags": tags, "metadata": metadata, "status": status, "score": score,
+        }])[0]
+
+    def add_papers_bulk(self, papers: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add many papers in a single transaction.
+
+        Args:
+            papers: Dicts keyed like the ``add_paper`` arguments; only
+                    ``title`` is required.
+
+        Returns:
+            Paper IDs in input order.
+        """
+        for p in papers:
+            _validate_status(p.get("status", "draft"))
+        ts    = _now()
+        stamp = _id_stamp()
+        pids  = [_paper_id(p["title"], stamp) for p in papers]
+        rows = [
+            (pid, p["title"], p.get("abstract", ""),
+             _join(p.get("authors")), _join(p.get("tags")),
+             p.get("status", "draft"), _clamp_score(p.get("score", 0.0)),
+             ts, ts, _dumps(p.get("metadata") or {}))
+            for pid, p in zip(pids, papers)
+        ]
+        with self._tx() as con:
+            # A colliding ID (same title in the same second) is skipped by
+            # OR IGNORE; only rows really inserted may contribute tags, and
+            # only once, from the first paper that claimed the ID.
+            inserted = {r[0] for r in _insert_rows(con, _SQL_INSERT_PAPER, rows, "id")}
+            tag_rows: List[Tuple[Any, ...]] = []
+            for pid, p in zip(pids, papers):
+                if pid in inserted:
+                    inserted.discard(pid)
+                    tag_rows += [(pid, t) for t in p.get("tags") or () if t]
+            _insert_rows(con, _SQL_INSERT_TAG, tag_rows)
+        return pids
+
+    def get_paper(
+        self, paper_id: str, with_children: bool = True
+    ) -> Optional[ResearchPaper]:
+        """Load a ResearchPaper by ID (see ``get_papers`` for ``with_children``)."""
+        papers = self.get_papers([paper_id], with_children)
+        return papers[0] if papers else None
+
+    def get_papers(
+        self, paper_ids: List[str], with_children: bool = True
+    ) -> List[ResearchPaper]:
+        """
+        Load several ResearchPapers with one query per table.
 
-    def get_paper(self, paper_id: str) -> Optional[ResearchPaper]:
-        """Load a full ResearchPaper by ID."""
-        with sqlite3.connect(self.db_path) as con:
-            con.row_factory = sqlite3.Row
-            row = con.execute("SELECT * FROM papers WHERE id=?", (paper_id,)).fetchone()
-            if not row:
-                return None
-            return self._row_to_paper(dict(row), con)
+        Unknown IDs are skipped; the rest are returned in input order.
+        With ``with_children=False`` only the papers table is read and
+        ``hypotheses`` / ``citations`` are left empty. IDs are queried in
+        chunks of ``_MAX_VARS`` to stay under SQLite's bound-variable limit.
+        """
+        unique = list(dict.fromkeys(paper_ids))
+        by_id:      Dict[str, sqlite3.Row]      = {}
+        hypotheses: Dict[str, List[Hypothesis]] = {}
+        citations:  Dict[str, List[Citation]]   = {}
+        with self._tx() as con:
+            for i in range(0, len(unique), _MAX_VARS):
+                chunk = unique[i:i + _MAX_VARS]
+                marks = ",".join("?" * len(chunk))
+                rows  = con.execute(
+                    f"SELECT * FROM papers WHERE id IN ({marks})", chunk
+                ).fetchall()
+                by_id.update((r["id"], r) for r in rows)
+                if rows and with_children:
+                    self._load_children(con, [r["id"] for r in rows], hypotheses, citations)
+        return [
+            self._row_to_paper(by_id[pid], hypotheses.get(pid, []),
+                               citations.get(pid, []))
+            for pid in unique if pid in by_id
+        ]
+
+    @staticmethod
+    def _load_children(
+        con:        sqlite3.Connection,
+        paper_ids:  List[str],
+        hypotheses: Dict[str, List[Hypothesis]],
+        citations:  Dict[str, List[Citation]],
+    ) -> None:
+        """Group the hypotheses and citations of ``paper_ids`` by paper."""
+        marks = ",".join("?" * len(paper_ids))
+        for h in con.execute(
+            # rowid breaks created_at ties (one bulk call shares a timestamp)
+            # in insertion order. Leading with paper_id lets a multi-ID IN
+            # read straight off idx_hyp_paper_created with no sort step.
+            f"SELECT * FROM hypotheses WHERE paper_id IN ({marks}) "
+            "ORDER BY paper_id, created_at, rowid",
+            paper_ids,
+        ):
+            hypotheses.setdefault(h["paper_id"], []).append(Hypothesis(
+                id=h["id"], text=h["text"], status=h["status"],
+                confidence=h["confidence"], evidence=_loads(h["evidence"]),
+                created_at=h["created_at"], updated_at=h["updated_at"],
+            ))
+        for c in con.execute(
+            f"SELECT * FROM citations WHERE paper_id IN ({marks}) ORDER BY paper_id, id",
+            paper_ids,
+        ):
+            citations.setdefault(c["paper_id"], []).append(Citation(
+                ref_id=c["ref_id"], title=c["title"],
+                authors=_loads(c["authors"]), year=c["year"],
+                url=c["url"], notes=c["notes"],
+            ))
 
     def update_score(self, paper_id: str, score: float) -> None:
         """Update the relevance/quality score (0–10)."""
-        with sqlite3.connect(self.db_path) as con:
-            con.execute("UPDATE papers SET score=?, updated_at=? WHERE id=?",
-                        (max(0.0, min(10.0, score)), _now(), paper_id))
+        with self._tx() as con:
+            con.execute(_SQL_UPDATE_SCORE, (_clamp_score(score), _now(), paper_id))
 
     def update_status(self, paper_id: str, status: str) -> None:
         """Transition paper status (draft→review→published→archived)."""
-        valid = {"draft", "review", "published", "archived"}
-        if status not in valid:
-            raise ValueError(f"Invalid status '{status}'. Choose from {valid}")
-        with sqlite3.connect(self.db_path) as con:
-            con.execute("UPDATE papers SET status=?, updated_at=? WHERE id=?",
-                        (status, _now(), paper_id))
+        _validate_status(status)
+        with self._tx() as con:
+            con.execute(_SQL_UPDATE_STATUS, (status, _now(), paper_id))
 
     def delete_paper(self, paper_id: str) -> bool:
-        with sqlite3.connect(self.db_path) as con:
-            for tbl in ("hypotheses", "citations"):
-                con.execute(f"DELETE FROM {tbl} WHERE paper_id=?", (paper_id,))
+        """Delete a paper; hypotheses, citations and tags go with it."""
+        with self._tx() as con:
             cur = con.execute("DELETE FROM papers WHERE id=?", (paper_id,))
             return cur.rowcount > 0
 
@@ -265,19 +615,35 @@ class ResearchAnalyzer:
         evidence:   Optional[List[str]] = None,
     ) -> str:
         """Register a hypothesis for a paper."""
-        ts  = _now()
-        hid = hashlib.md5(f"{paper_id}{text}{ts}".encode()).hexdigest()[:12]
-        with sqlite3.connect(self.db_path) as con:
-            con.execute(
-                """
-                INSERT INTO hypotheses (id, paper_id, text, status, confidence,
-                                        evidence, created_at, updated_at)
-                VALUES (?, ?, ?, 'proposed', ?, ?, ?, ?)
-                """,
-                (hid, paper_id, text, confidence,
-                 json.dumps(evidence or []), ts, ts),
-            )
-        return hid
+        return self.add_hypotheses_bulk([{
+            "paper_id": paper_id, "text": text,
+            "confidence": confidence, "evidence": evidence,
+        }])[0]
+
+    def add_hypotheses_bulk(self, hypotheses: List[Dict[str, Any]]) -> List[str]:
+        """
+        Register many hypotheses in a single transaction.
+
+        Args:
+            hypotheses: Dicts keyed like the ``add_hypothesis`` arguments;
+                        ``paper_id`` and ``text`` are required.
+
+        Returns:
+            Hypothesis IDs in input order.
+        """
+        ts   = _now()
+        # The batch shares one timestamp, so the row's position keeps
+        # repeated texts for the same paper from hashing to the same ID.
+        rows = [
+            (hashlib.blake2b(f"{h['paper_id']}{h['text']}{ts}#{i}".encode(),
+                             digest_size=6).hexdigest(),
+             h["paper_id"], h["text"], h.get("confidence", 0.5),
+             _dumps(h.get("evidence") or []), ts, ts)
+            for i, h in enumerate(hypotheses)
+        ]
+        with self._tx() as con:
+            con.executemany(_SQL_INSERT_HYPOTHESIS, rows)
+        return [r[0] for r in rows]
 
     def update_hypothesis(
         self,
@@ -287,19 +653,14 @@ class ResearchAnalyzer:
         evidence:   Optional[List[str]] = None,
     ) -> None:
         """Update hypothesis status, confidence, or evidence list."""
-        with sqlite3.connect(self.db_path) as con:
-            row = con.execute(
-                "SELECT * FROM hypotheses WHERE id=?", (hyp_id,)
-            ).fetchone()
-            if not row:
-                raise KeyError(f"Hypothesis '{hyp_id}' not found")
-            new_status     = status     or row[3]
-            new_confidence = confidence if confidence is not None else row[4]
-            ev_list        = evidence   or json.loads(row[5])
-            con.execute(
-                "UPDATE hypotheses SET status=?, confidence=?, evidence=?, updated_at=? WHERE id=?",
-                (new_status, new_confidence, json.dumps(ev_list), _now(), hyp_id),
+        with self._tx() as con:
+            cur = con.execute(
+                _SQL_UPDATE_HYPOTHESIS,
+                (status or None, confidence, _dumps(evidence) if evidence else None,
+                 _now(), hyp_id),
             )
+            if cur.rowcount == 0:
+                raise KeyError(f"Hypothesis '{hyp_id}' not found")
 
     # ── Citations ─────────────────────────────────────────────────────────────
 
@@ -314,14 +675,26 @@ class ResearchAnalyzer:
         notes:    str                 = "",
     ) -> None:
         """Register a citation for a paper."""
-        with sqlite3.connect(self.db_path) as con:
-            con.execute(
-                """
-                INSERT INTO citations (paper_id, ref_id, title, authors, year, url, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (paper_id, ref_id, title, json.dumps(authors or []), year, url, notes),
-            )
+        self.add_citations_bulk([{
+            "paper_id": paper_id, "ref_id": ref_id, "title": title,
+            "authors": authors, "year": year, "url": url, "notes": notes,
+        }])
+
+    def add_citations_bulk(self, citations: List[Dict[str, Any]]) -> None:
+        """
+        Register many citations in a single transaction.
+
+        Args:
+            citations: Dicts keyed like the ``add_citation`` arguments;
+                       ``paper_id``, ``ref_id`` and ``title`` are required.
+        """
+        rows = [
+            (c["paper_id"], c["ref_id"], c["title"], _dumps(c.get("authors") or []),
+             c.get("year"), c.get("url", ""), c.get("notes", ""))
+            for c in citations
+        ]
+        with self._tx() as con:
+            con.executemany(_SQL_INSERT_CITATION, rows)
 
     # ── Search & Queries ──────────────────────────────────────────────────────
 
@@ -329,33 +702,36 @@ class ResearchAnalyzer:
         """
         Full-text search over title, abstract, and tags.
 
-        Falls back to LIKE-based search if FTS5 is unavailable.
+        The trigram index matches substrings of three or more characters;
+        shorter queries, and ones FTS5 cannot parse, fall back to LIKE.
         """
-        q = query.lower()
-        with sqlite3.connect(self.db_path) as con:
-            con.row_factory = sqlite3.Row
-            try:
-                rows = con.execute(
-                    """
-                    SELECT p.* FROM papers p
-                    JOIN papers_fts f ON p.id = f.id
-                    WHERE papers_fts MATCH ? ORDER BY rank LIMIT ?
-                    """,
-                    (query, limit),
-                ).fetchall()
-            except sqlite3.OperationalError:
+        q    = query.lower()
+        rows = None
+        with self._tx() as con:
+            if len(query) >= 3:
+                try:
+                    # Resolve the MATCH on its own first so the planner always
+                    # drives the query from the FTS index, then join by rowid.
+                    rows = con.execute(
+                        f"""
+                        WITH m AS (
+                            SELECT rowid, bm25(papers_fts) AS r FROM papers_fts
+                            WHERE papers_fts MATCH ? ORDER BY r LIMIT ?
+                        )
+                        SELECT {_SUMMARY_COLS} FROM m JOIN papers p ON p.rowid = m.rowid
+                        ORDER BY m.r
+                        """,
+                        (query, limit),
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    pass
+            if rows is None:
                 # FTS fallback
                 rows = con.execute(
-                    """
-                    SELECT * FROM papers
-                    WHERE lower(title)    LIKE ?
-                       OR lower(abstract) LIKE ?
-                       OR lower(tags)     LIKE ?
-                    LIMIT ?
-                    """,
-                    (f"%{q}%", f"%{q}%", f"%{q}%", limit),
+                    f"SELECT {_SUMMARY_COLS} FROM papers WHERE search_blob LIKE ? LIMIT ?",
+                    (f"%{q}%", limit),
                 ).fetchall()
-        return [self._row_to_summary(dict(r)) for r in rows]
+        return [self._row_to_summary(r) for r in rows]
 
     def list_papers(
         self,
@@ -370,104 +746,105 @@ class ResearchAnalyzer:
         if status:
             clauses.append("status = ?")
             params.append(status)
+        if tag:
+            clauses.append("id IN (SELECT paper_id FROM paper_tags WHERE tag = ?)")
+            params.append(tag)
         where = "WHERE " + " AND ".join(clauses)
-        with sqlite3.connect(self.db_path) as con:
-            con.row_factory = sqlite3.Row
+        with self._tx() as con:
             rows = con.execute(
-                f"SELECT * FROM papers {where} ORDER BY score DESC LIMIT ?",
+                f"SELECT {_SUMMARY_COLS} FROM papers {where} ORDER BY score DESC LIMIT ?",
                 params + [limit],
             ).fetchall()
-        result = [self._row_to_summary(dict(r)) for r in rows]
-        if tag:
-            result = [r for r in result if tag.lower() in [t.lower() for t in r["tags"]]]
-        return result
+        return [self._row_to_summary(r) for r in rows]
 
     def corpus_stats(self) -> Dict[str, Any]:
         """Return aggregate statistics for the full corpus."""
-        with sqlite3.connect(self.db_path) as con:
-            total     = con.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
-            by_status = dict(con.execute(
-                "SELECT status, COUNT(*) FROM papers GROUP BY status"
-            ).fetchall())
-            avg_score = con.execute("SELECT AVG(score) FROM papers WHERE score > 0").fetchone()[0]
-            hyp_count = con.execute("SELECT COUNT(*) FROM hypotheses").fetchone()[0]
-            confirmed = con.execute(
-                "SELECT COUNT(*) FROM hypotheses WHERE status='confirmed'"
-            ).fetchone()[0]
-            tag_rows  = con.execute("SELECT tags FROM papers").fetchall()
-
-        all_tags: Dict[str, int] = {}
-        for (tags_json,) in tag_rows:
-            for t in json.loads(tags_json or "[]"):
-                all_tags[t] = all_tags.get(t, 0) + 1
-        top_tags = sorted(all_tags.items(), key=lambda x: x[1], reverse=True)[:10]
+        with self._tx() as con:
+            # One pass over the (status, score) index covers all paper totals.
+            groups = con.execute(
+                """
+                SELECT status, COUNT(*),
+                       TOTAL(CASE WHEN score > 0 THEN score END),
+                       COUNT(CASE WHEN score > 0 THEN 1 END)
+                FROM papers GROUP BY status
+                """
+            ).fetchall()
+            hyp_count, confirmed = con.execute(
+                "SELECT COUNT(*), COALESCE(SUM(status = 'confirmed'), 0) FROM hypotheses"
+            ).fetchone()
+            top_tags = [tuple(r) for r in con.execute(
+                """
+                SELECT tag, COUNT(*) AS c FROM paper_tags
+                GROUP BY tag ORDER BY c DESC, tag LIMIT 10
+                """
+            )]
+
+        by_status = {status: n for status, n, _, _ in groups}
+        total     = sum(by_status.values())
+        scored    = sum(g[3] for g in groups)
+        avg_score = sum(g[2] for g in groups) / scored if scored else 0.0
 
         return {
             "total_papers":        total,
             "by_status":           by_status,
-            "avg_score":           round(avg_score or 0.0, 2),
+            "avg_score":           round(avg_score, 2),
             "total_hypotheses":    hyp_count,
             "confirmed_hypotheses": confirmed,
             "confirmation_rate":   round(confirmed / hyp_count, 3) if hyp_count else 0.0,
             "top_tags":            top_tags,
         }
 
+    def compact(self) -> None:
+        """
+        Merge FTS index segments and refresh planner statistics.
+
+        Worth running after bulk loads, which leave the FTS5 index split
+        across many small segments.
+        """
+        with self._tx() as con:
+            con.execute("INSERT INTO papers_fts(papers_fts) VALUES ('optimize')")
+            con.execute("ANALYZE")
+            con.execute("PRAGMA optimize")
+
     def top_papers(self, n: int = 5, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """Return top-N papers by score."""
         return self.list_papers(status=status, limit=n)
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
-    def _row_to_paper(self, row: Dict[str, Any], con: sqlite3.Connection) -> ResearchPaper:
+    def _row_to_paper(
+        self,
+        row:        sqlite3.Row,
+        hypotheses: List[Hypothesis],
+        citations:  List[Citation],
+    ) -> ResearchPaper:
         pid = row["id"]
-        con.row_factory = sqlite3.Row
-
-        hyp_rows = con.execute(
-            "SELECT * FROM hypotheses WHERE paper_id=? ORDER BY created_at", (pid,)
-        ).fetchall()
-        hypotheses = [
-            Hypothesis(
-                id=h["id"], text=h["text"], status=h["status"],
-                confidence=h["confidence"], evidence=json.loads(h["evidence"]),
-                created_at=h["created_at"], updated_at=h["updated_at"],
-            )
-            for h in hyp_rows
-        ]
-
-        cit_rows  = con.execute("SELECT * FROM citations WHERE paper_id=?", (pid,)).fetchall()
-        citations = [
-            Citation(
-                ref_id=c["ref_id"], title=c["title"],
-                authors=json.loads(c["authors"]), year=c["year"],
-                url=c["url"], notes=c["notes"],
-            )
-            for c in cit_rows
-        ]
-
         return ResearchPaper(
             id=pid,
             title=row["title"],
             abstract=row["abstract"],
-            authors=json.loads(row.get("authors") or "[]"),
-            tags=json.loads(row.get("tags")    or "[]"),
+            authors=_split(row["authors"]),
+            tags=_split(row["tags"]),
             hypotheses=hypotheses,
             citations=citations,
             status=row["status"],
             score=row["score"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
-            metadata=json.loads(row.get("metadata") or "{}"),
+            metadata=_loads(row["metadata"]),
         )
 
-    def _row_to_summary(self, row: Dict[str, Any]) -> Dict[str, Any]:
+    def _row_to_summary(self, row: sqlite3.Row) -> Dict[str, Any]:
+        # Positional unpack (rows follow _SUMMARY_COLS) skips per-name lookups.
+        pid, title, status, score, authors, tags, created_at = row
         return {
-            "id":         row["id"],
-            "title":      row["title"],
-            "status":     row["status"],
-            "score":      row["score"],
-            "authors":    json.loads(row.get("authors") or "[]"),
-            "tags":       json.loads(row.get("tags")    or "[]"),
-            "created_at": row["created_at"],
+            "id":         pid,
+            "title":      title,
+            "status":     status,
+            "score":      score,
+            "authors":    _split(authors),
+            "tags":       _split(tags),
+            "created_at": created_at,
         }
 
 
@@ -476,13 +853,69 @@ class ResearchAnalyzer:
 # ──────────────────────────────────────────────────────────────────────────────
 
 def _now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """UTC ISO-8601 timestamp with microseconds, without building a datetime."""
+    t = time.time()
+    return (time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t))
+            + f".{int(t % 1 * 1e6):06d}+00:00")
+
+
+def _validate_status(status: str) -> None:
+    if status not in ResearchAnalyzer.VALID_STATUSES:
+        raise ValueError(
+            f"Invalid status '{status}'. "
+            f"Choose from {', '.join(sorted(ResearchAnalyzer.VALID_STATUSES))}"
+        )
+
+
+def _clamp_score(score: float) -> float:
+    # NaN fails both comparisons and clamps to 10.0, as max/min did.
+    return 0.0 if score < 0.0 else score if score <= 10.0 else 10.0
+
 
+def _join(items: Optional[List[str]]) -> str:
+    # Empty strings are dropped: they could not be told apart on _split.
+    return _LIST_SEP.join(filter(None, items or ()))
 
-def _paper_id(title: str) -> str:
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
-    h  = hashlib.md5(f"{title}{ts}".encode()).hexdigest()[:10]
-    slug = re.sub(r"[^a-z0-9]+", "-", title.lower())[:24].strip("-")
+
+def _split(text: str) -> List[str]:
+    return text.split(_LIST_SEP) if text else []
+
+
+def _insert_rows(
+    con:       sqlite3.Connection,
+    head:      str,
+    rows:      List[Tuple[Any, ...]],
+    returning: str = "",
+) -> List[sqlite3.Row]:
+    """
+    Run ``head`` with a multi-row VALUES list, chunked under ``_MAX_VARS``.
+
+    With ``returning`` (e.g. ``"id"``) a RETURNING clause is appended and
+    the rows it yields are collected: only rows actually inserted, so
+    those skipped by OR IGNORE are left out.
+    """
+    if not rows:
+        return []
+    width  = len(rows[0])
+    step   = _MAX_VARS // width
+    marks  = "(" + ",".join("?" * width) + ")"
+    suffix = f" RETURNING {returning}" if returning else ""
+    out: List[sqlite3.Row] = []
+    for i in range(0, len(rows), step):
+        chunk = rows[i:i + step]
+        out += con.execute(f"{head} VALUES {','.join([marks] * len(chunk))}{suffix}",
+                           [v for row in chunk for v in row]).fetchall()
+    return out
+
+
+def _id_stamp() -> str:
+    return time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+
+
+def _paper_id(title: str, ts: Optional[str] = None) -> str:
+    ts = ts or _id_stamp()
+    h  = hashlib.blake2b(f"{title}{ts}".encode(), digest_size=5).hexdigest()
+    slug = _SLUG_RE.sub("-", title.lower())[:24].strip("-")
     return f"{slug}-{h}"
 
 
@@ -560,20 +993,20 @@ DEMO_PAPERS = [
 def _run_demo(ra: ResearchAnalyzer) -> None:
     print("\n\U0001f9ea BlackRoad Labs — Research Corpus Demo\n")
 
-    paper_ids = []
-    for p in DEMO_PAPERS:
-        pid = ra.add_paper(
-            title=p["title"], abstract=p["abstract"],
-            authors=p.get("authors", []), tags=p.get("tags", []),
-        )
-        ra.update_score(pid, p["score"])
-        ra.update_status(pid, "published")
-        for hyp_text, conf in p.get("hypotheses", []):
-            ra.add_hypothesis(pid, hyp_text, confidence=conf)
-        for cit in p.get("citations", []):
-            ra.add_citation(pid, *cit)
-        paper_ids.append(pid)
-        print(f"  + {p['title'][:55]:<55} score={p['score']}")
+    with ra.bulk():
+        paper_ids  = ra.add_papers_bulk([{**p, "status": "published"} for p in DEMO_PAPERS])
+        hypotheses: List[Dict[str, Any]] = []
+        citations:  List[Dict[str, Any]] = []
+        for pid, p in zip(paper_ids, DEMO_PAPERS):
+            hypotheses += [{"paper_id": pid, "text": text, "confidence": conf}
+                           for text, conf in p.get("hypotheses", [])]
+            citations  += [{"paper_id": pid, "ref_id": ref_id, "title": title,
+                            "authors": authors, "year": year}
+                           for ref_id, title, authors, year in p.get("citations", [])]
+            print(f"  + {p['title'][:55]:<55} score={p['score']}")
+        ra.add_hypotheses_bulk(hypotheses)
+        ra.add_citations_bulk(citations)
+    ra.compact()
 
     print("\n\U0001f4ca Corpus statistics:")
     stats = ra.corpus_stats()
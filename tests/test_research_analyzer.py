@@ -1,16 +1,32 @@
 """Tests for src/research_analyzer.py"""
 from __future__ import annotations
+from dataclasses import asdict, fields
 from pathlib import Path
+from typing import Iterator
+import json
+import re
+import sqlite3
 import pytest
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from src.research_analyzer import ResearchAnalyzer, ResearchPaper, Hypothesis
 
+_RX_CLI_OUT = re.compile(r"score=|Papers")
+
+
+@pytest.fixture(scope="module")
+def ra(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ResearchAnalyzer]:
+    db = tmp_path_factory.mktemp("ra") / "test_research.db"
+    with ResearchAnalyzer(db_path=db, fast=True) as analyzer:
+        yield analyzer
 
-@pytest.fixture
-def ra(tmp_path: Path) -> ResearchAnalyzer:
-    return ResearchAnalyzer(db_path=tmp_path / "test_research.db")
+
+@pytest.fixture(autouse=True)
+def _rollback(ra: ResearchAnalyzer) -> Iterator[None]:
+    """Run each test inside a savepoint so the shared DB starts empty."""
+    ra._con.execute("SAVEPOINT test")
+    yield
+    ra._con.execute("ROLLBACK TO test")
+    ra._con.execute("RELEASE test")
 
 
 @pytest.fixture
@@ -30,13 +46,37 @@ class TestAddPaper:
         pid = ra.add_paper("Test Paper")
         assert isinstance(pid, str) and len(pid) > 5
 
+    def test_ids_are_title_slugs(self, ra):
+        pids = ra.add_papers_bulk([{"title": "Trinary Logic!"}, {"title": "Trinary Logic?"}])
+        assert all(pid.startswith("trinary-logic-") for pid in pids)
+        assert len(set(pids)) == 2
+
     def test_get_paper_roundtrip(self, ra, sample_paper):
         paper = ra.get_paper(sample_paper)
         assert paper is not None
         assert paper.title == "Emergence in Multi-Agent Systems"
-        assert paper.score == pytest.approx(8.5)
+        assert paper.score == 8.5
         assert "emergence" in paper.tags
 
+    def test_get_papers_batch(self, ra, sample_paper):
+        other = ra.add_paper("Second Paper")
+        ra.add_hypothesis(other, "Only on the second", confidence=0.4)
+        papers = ra.get_papers([other, "nonexistent-id", sample_paper])
+        assert [p.id for p in papers] == [other, sample_paper]
+        assert [h.text for h in papers[0].hypotheses] == ["Only on the second"]
+        assert papers[1].hypotheses == []
+
+    def test_get_paper_without_children(self, ra, sample_paper):
+        ra.add_hypothesis(sample_paper, "Not loaded")
+        paper = ra.get_paper(sample_paper, with_children=False)
+        assert paper.title == "Emergence in Multi-Agent Systems"
+        assert paper.hypotheses == [] and paper.citations == []
+        assert len(ra.get_paper(sample_paper).hypotheses) == 1
+
+    def test_get_papers_chunks_large_id_lists(self, ra, sample_paper):
+        ids = [f"missing-{i}" for i in range(1500)] + [sample_paper]
+        assert [p.id for p in ra.get_papers(ids)] == [sample_paper]
+
     def test_missing_paper_returns_none(self, ra):
         assert ra.get_paper("nonexistent-id") is None
 
@@ -49,17 +89,186 @@ class TestAddPaper:
         with pytest.raises(ValueError, match="Invalid status"):
             ra.update_status(sample_paper, "super-published")
 
+    def test_add_paper_with_status_and_score(self, ra):
+        pid = ra.add_paper("Imported", status="published", score=12.0)
+        paper = ra.get_paper(pid)
+        assert paper.status == "published"
+        assert paper.score == 10.0
+
+    def test_update_score_clamps_nan(self, ra, sample_paper):
+        ra.update_score(sample_paper, float("nan"))
+        assert ra.get_paper(sample_paper).score == 10.0
+
+    def test_add_paper_invalid_status_raises(self, ra):
+        with pytest.raises(ValueError, match="Invalid status"):
+            ra.add_paper("Bad", status="super-published")
+
+    def test_add_papers_bulk(self, ra):
+        pids = ra.add_papers_bulk([
+            {"title": "Bulk One", "tags": ["bulk"]},
+            {"title": "Bulk Two", "abstract": "second", "authors": ["C. Ellis"]},
+        ])
+        assert len(pids) == 2
+        assert ra.get_paper(pids[0]).tags == ["bulk"]
+        assert ra.get_paper(pids[1]).authors == ["C. Ellis"]
+
+    def test_metadata_non_str_keys(self, ra):
+        pid = ra.add_paper("Keyed", metadata={1: "x", "k": [1, 2]})
+        assert ra.get_paper(pid).metadata == {"1": "x", "k": [1, 2]}
+
+    def test_colliding_id_leaves_tags_in_sync(self, ra, monkeypatch):
+        # Pin the ID stamp so both calls land in "the same second".
+        monkeypatch.setattr("src.research_analyzer._id_stamp", lambda: "20250101T000000")
+        first  = ra.add_paper("Same Title", tags=["alpha"])
+        second = ra.add_paper("Same Title", tags=["beta"])
+        assert first == second
+        assert ra.list_papers(tag="beta") == []
+        assert ra.get_paper(first).tags == ["alpha"]
+        assert "beta" not in dict(ra.corpus_stats()["top_tags"])
+
+    def test_repeated_title_in_batch_tags_once(self, ra):
+        pids = ra.add_papers_bulk([
+            {"title": "Twin", "tags": ["one"]}, {"title": "Twin", "tags": ["two"]},
+        ])
+        assert pids[0] == pids[1]
+        assert ra.get_paper(pids[0]).tags == ["one"]
+        assert ra.list_papers(tag="two") == []
+
+    def test_empty_authors_and_tags_dropped(self, ra):
+        pid = ra.add_paper("Blanks", authors=["", "C. Ellis"], tags=[""])
+        paper = ra.get_paper(pid)
+        assert paper.authors == ["C. Ellis"]
+        assert paper.tags == []
+        assert ra.corpus_stats()["top_tags"] == []
+
+    def test_add_papers_bulk_spans_chunks(self, ra):
+        pids = ra.add_papers_bulk(
+            [{"title": f"Chunked {i}", "tags": ["chunk", f"n{i}"]} for i in range(250)]
+        )
+        assert len(set(pids)) == 250
+        assert ra.corpus_stats()["total_papers"] == 250
+        assert len(ra.list_papers(tag="chunk", limit=300)) == 250
+        assert ra.get_paper(pids[-1]).tags == ["chunk", "n249"]
+
+    def test_bulk_rolls_back_on_error(self, ra):
+        # Nested here: the autouse savepoint already holds a transaction.
+        with pytest.raises(ValueError):
+            with ra.bulk():
+                ra.add_paper("Kept Only If Committed")
+                ra.add_paper("Bad", status="super-published")
+        assert ra.corpus_stats()["total_papers"] == 0
+        with ra.bulk():
+            pid = ra.add_paper("Committed")
+        assert ra.get_paper(pid) is not None
+
     def test_delete_paper(self, ra, sample_paper):
         assert ra.delete_paper(sample_paper) is True
         assert ra.get_paper(sample_paper) is None
 
+    def test_delete_paper_removes_children(self, ra, sample_paper):
+        ra.add_hypothesis(sample_paper, "Gone with the paper")
+        ra.add_citation(sample_paper, "ref-009", "Also gone")
+        ra.delete_paper(sample_paper)
+        assert ra.corpus_stats()["total_hypotheses"] == 0
+        assert ra.list_papers(tag="emergence") == []
+
+
+class TestConnection:
+    def test_context_manager_closes(self, tmp_path):
+        with ResearchAnalyzer(db_path=tmp_path / "cm.db") as ra:
+            pid = ra.add_paper("Scoped Paper")
+            assert ra.get_paper(pid) is not None
+        with pytest.raises(sqlite3.ProgrammingError):
+            ra.get_paper(pid)
+
+    def test_close_is_idempotent(self, tmp_path):
+        ra = ResearchAnalyzer(db_path=tmp_path / "close.db")
+        ra.close()
+        ra.close()
+
+    def test_writes_commit_without_bulk(self, tmp_path):
+        db = tmp_path / "autocommit.db"
+        with ResearchAnalyzer(db_path=db) as ra:
+            pid = ra.add_paper("Visible Elsewhere")
+            with pytest.raises(sqlite3.IntegrityError):
+                ra.add_hypothesis("nonexistent-id", "Orphan")
+            assert ra._con.in_transaction is False
+            other = sqlite3.connect(db)
+            assert other.execute("SELECT id FROM papers").fetchall() == [(pid,)]
+            other.close()
+
+    def test_fast_pragmas_opt_out(self, tmp_path):
+        with ResearchAnalyzer(db_path=tmp_path / "fast.db") as ra:
+            assert ra._con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with ResearchAnalyzer(db_path=tmp_path / "safe.db", fast=False) as ra:
+            assert ra._con.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            assert ra._con.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_mmap_bytes_knob(self, tmp_path):
+        with ResearchAnalyzer(db_path=tmp_path / "map.db", mmap_bytes=1 << 20) as ra:
+            assert ra._con.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 20
+        with ResearchAnalyzer(db_path=tmp_path / "nomap.db", mmap_bytes=0) as ra:
+            assert ra._con.execute("PRAGMA mmap_size").fetchone()[0] == 0
+
+
+class TestMigration:
+    def test_legacy_fts_table_rebuilt(self, tmp_path):
+        db = tmp_path / "legacy.db"
+        ResearchAnalyzer(db_path=db).close()
+        con = sqlite3.connect(db)
+        con.executescript("""
+            DROP TABLE papers_fts;
+            CREATE VIRTUAL TABLE papers_fts USING fts5(id UNINDEXED, title, abstract,
+                tags, content='papers', content_rowid='rowid');
+            INSERT INTO papers (id, title, abstract, created_at, updated_at)
+            VALUES ('legacy-1', 'Legacy Emergence Notes', '', '', '');
+        """)
+        con.close()
+        with ResearchAnalyzer(db_path=db) as ra:
+            assert [r["id"] for r in ra.search("emergence")] == ["legacy-1"]
+
+    def test_legacy_json_lists_migrated(self, tmp_path):
+        db = tmp_path / "legacy-json.db"
+        ResearchAnalyzer(db_path=db).close()
+        con = sqlite3.connect(db)
+        con.executescript("""
+            PRAGMA user_version = 0;
+            INSERT INTO papers (id, title, authors, tags, created_at, updated_at)
+            VALUES ('legacy-2', 'Old Paper', '["A. Author"]', '["memory", "ps-sha"]', '', '');
+        """)
+        con.close()
+        with ResearchAnalyzer(db_path=db) as ra:
+            paper = ra.get_paper("legacy-2")
+            assert paper.authors == ["A. Author"]
+            assert paper.tags == ["memory", "ps-sha"]
+            assert [p["id"] for p in ra.list_papers(tag="ps-sha")] == ["legacy-2"]
+
+    def test_legacy_papers_table_gains_search_blob(self, tmp_path):
+        db = tmp_path / "legacy-blob.db"
+        con = sqlite3.connect(db)
+        con.executescript("""
+            CREATE TABLE papers (
+                id TEXT PRIMARY KEY, title TEXT NOT NULL,
+                abstract TEXT NOT NULL DEFAULT '', authors TEXT NOT NULL DEFAULT '[]',
+                tags TEXT NOT NULL DEFAULT '[]', status TEXT NOT NULL DEFAULT 'draft',
+                score REAL NOT NULL DEFAULT 0.0, created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL, metadata TEXT NOT NULL DEFAULT '{}'
+            );
+            INSERT INTO papers (id, title, tags, created_at, updated_at)
+            VALUES ('legacy-3', 'Old Notes', '["ab"]', '', '');
+        """)
+        con.close()
+        with ResearchAnalyzer(db_path=db) as ra:
+            assert [r["id"] for r in ra.search("ab")] == ["legacy-3"]
+            assert [r["id"] for r in ra.search("notes")] == ["legacy-3"]
+
 
 class TestHypotheses:
     def test_add_hypothesis(self, ra, sample_paper):
         hid = ra.add_hypothesis(sample_paper, "Agents self-organize", confidence=0.7)
         paper = ra.get_paper(sample_paper)
         assert len(paper.hypotheses) == 1
-        assert paper.hypotheses[0].confidence == pytest.approx(0.7)
+        assert paper.hypotheses[0].confidence == 0.7
 
     def test_update_hypothesis_status(self, ra, sample_paper):
         hid = ra.add_hypothesis(sample_paper, "Test hypothesis", confidence=0.5)
@@ -67,7 +276,44 @@ class TestHypotheses:
         paper = ra.get_paper(sample_paper)
         h = paper.hypotheses[0]
         assert h.status == "confirmed"
-        assert h.confidence == pytest.approx(0.95)
+        assert h.confidence == 0.95
+
+    def test_update_hypothesis_keeps_unset_fields(self, ra, sample_paper):
+        hid = ra.add_hypothesis(sample_paper, "Partial", confidence=0.3,
+                                evidence=["obs-1"])
+        ra.update_hypothesis(hid, status="testing")
+        h = ra.get_paper(sample_paper).hypotheses[0]
+        assert h.status == "testing"
+        assert h.confidence == 0.3
+        assert h.evidence == ["obs-1"]
+
+    def test_update_missing_hypothesis_raises(self, ra):
+        with pytest.raises(KeyError):
+            ra.update_hypothesis("nonexistent-id", status="confirmed")
+
+    def test_add_hypotheses_bulk(self, ra, sample_paper):
+        hids = ra.add_hypotheses_bulk([
+            {"paper_id": sample_paper, "text": "First", "confidence": 0.2},
+            {"paper_id": sample_paper, "text": "Second"},
+        ])
+        paper = ra.get_paper(sample_paper)
+        assert {h.id for h in paper.hypotheses} == set(hids)
+
+    def test_bulk_hypotheses_allow_duplicate_text(self, ra, sample_paper):
+        hids = ra.add_hypotheses_bulk(
+            [{"paper_id": sample_paper, "text": "Same claim"}] * 2
+        )
+        assert len(set(hids)) == 2
+        assert len(ra.get_paper(sample_paper).hypotheses) == 2
+
+    def test_bulk_hypotheses_keep_insertion_order(self, ra, sample_paper):
+        texts = [f"Hypothesis {i}" for i in range(8)]
+        ra.add_hypotheses_bulk([{"paper_id": sample_paper, "text": t} for t in texts])
+        assert [h.text for h in ra.get_paper(sample_paper).hypotheses] == texts
+
+    def test_hypothesis_requires_existing_paper(self, ra):
+        with pytest.raises(sqlite3.IntegrityError):
+            ra.add_hypothesis("nonexistent-id", "Orphan")
 
     def test_hypothesis_is_active(self):
         h = Hypothesis(id="x", text="t", status="proposed", confidence=0.5)
@@ -78,9 +324,14 @@ class TestHypotheses:
     def test_update_confidence_clamped(self):
         h = Hypothesis(id="x", text="t", status="proposed", confidence=0.9)
         h.update_confidence(0.5)
-        assert h.confidence == pytest.approx(1.0)
+        assert h.confidence == 1.0
         h.update_confidence(-2.0)
-        assert h.confidence == pytest.approx(0.0)
+        assert h.confidence == 0.0
+
+    def test_update_confidence_nan_clamped(self):
+        h = Hypothesis(id="x", text="t", status="proposed", confidence=0.5)
+        h.update_confidence(float("nan"))
+        assert h.confidence == 1.0
 
 
 class TestCitations:
@@ -102,10 +353,46 @@ class TestSearch:
         results = ra.search("xyzzy_not_found_12345")
         assert results == []
 
+    def test_search_matches_substring(self, ra, sample_paper):
+        ids = [r["id"] for r in ra.search("mergen")]
+        assert sample_paper in ids
+
+    def test_search_prefix_matches_word_forms(self, ra, sample_paper):
+        other = ra.add_paper("Emergent Coordination")
+        assert {r["id"] for r in ra.search("emergen")} == {sample_paper, other}
+
+    def test_search_short_query_falls_back(self, ra, sample_paper):
+        ids = [r["id"] for r in ra.search("mu")]
+        assert sample_paper in ids
+
+    def test_search_after_delete(self, ra, sample_paper):
+        ra.delete_paper(sample_paper)
+        assert ra.search("emergence") == []
+
+    def test_fts_follows_updates(self, ra, sample_paper):
+        with ra._tx() as con:
+            con.execute("UPDATE papers SET abstract = 'percolation thresholds' WHERE id = ?",
+                        (sample_paper,))
+            con.execute("INSERT INTO papers_fts(papers_fts) VALUES ('integrity-check')")
+        assert [r["id"] for r in ra.search("percolation")] == [sample_paper]
+        assert ra.search("contradiction pressure") == []
+
     def test_list_by_tag(self, ra, sample_paper):
         papers = ra.list_papers(tag="multi-agent")
         assert any(p["id"] == sample_paper for p in papers)
 
+    def test_list_by_tag_ignores_case(self, ra):
+        pid = ra.add_paper("Mixed Case Tags", tags=["Emergence", "emergence", "PS-SHA"])
+        assert [p["id"] for p in ra.list_papers(tag="ps-sha")] == [pid]
+        assert dict(ra.corpus_stats()["top_tags"])["Emergence"] == 1
+
+    def test_list_by_tag_applies_limit_after_filter(self, ra, sample_paper):
+        for i in range(3):
+            pid = ra.add_paper(f"Untagged {i}")
+            ra.update_score(pid, 9.5)
+        papers = ra.list_papers(tag="Emergence", limit=1)
+        assert [p["id"] for p in papers] == [sample_paper]
+
     def test_list_min_score(self, ra, sample_paper):
         papers = ra.list_papers(min_score=9.0)
         assert all(p["score"] >= 9.0 for p in papers)
@@ -120,11 +407,30 @@ class TestCorpusStats:
         assert "top_tags"         in stats
 
     def test_total_papers_count(self, ra):
-        for i in range(3):
-            ra.add_paper(f"Paper {i}", tags=["test"])
+        with ra.bulk():
+            for i in range(3):
+                ra.add_paper(f"Paper {i}", tags=["test"])
         stats = ra.corpus_stats()
         assert stats["total_papers"] >= 3
 
+    def test_status_counts_and_avg_skip_unscored(self, ra, sample_paper):
+        ra.add_paper("Published", status="published", score=6.5)
+        ra.add_paper("Unscored")
+        stats = ra.corpus_stats()
+        assert stats["total_papers"] == 3
+        assert stats["by_status"] == {"draft": 2, "published": 1}
+        assert stats["avg_score"] == 7.5
+
+    def test_top_tags_counted(self, ra, sample_paper):
+        ra.add_paper("Another", tags=["emergence", "scale"])
+        top = dict(ra.corpus_stats()["top_tags"])
+        assert top["emergence"] == 2
+        assert top["multi-agent"] == 1
+
+    def test_compact_keeps_search_working(self, ra, sample_paper):
+        ra.compact()
+        assert [r["id"] for r in ra.search("emergence")] == [sample_paper]
+
 
 class TestResearchPaperModel:
     def test_word_count(self):
@@ -137,6 +443,27 @@ class TestResearchPaperModel:
         assert p.matches_query("trinary") is True
         assert p.matches_query("xyz_no") is False
 
+    def test_text_caches_follow_reassignment(self):
+        p = ResearchPaper(id="x", title="Trinary Logic", abstract="one two")
+        assert p.matches_query("trinary") and p.word_count() == 2
+        p.title = "Binary Logic"
+        p.abstract = "one two three"
+        assert p.matches_query("trinary") is False
+        assert p.matches_query("binary") is True
+        assert p.word_count() == 3
+
+    def test_text_cache_not_a_field(self):
+        p = ResearchPaper(id="x", title="Trinary Logic", tags=["logic"])
+        p.matches_query("logic")
+        assert "_cache" not in {f.name for f in fields(p)}
+        assert json.loads(json.dumps(asdict(p)))["tags"] == ["logic"]
+
+    def test_matches_any(self):
+        p = ResearchPaper(id="x", title="Trinary Logic", abstract="uncertain world",
+                          tags=["logic"])
+        assert p.matches_any(["xyz_no", "uncertain"]) is True
+        assert p.matches_any(["xyz_no"]) is False
+
 
 class TestCLI:
     def test_demo_command(self, tmp_path, monkeypatch, capsys):
@@ -145,7 +472,7 @@ class TestCLI:
         rc = main(["demo"])
         assert rc == 0
         out = capsys.readouterr().out
-        assert "score=" in out or "Papers" in out
+        assert _RX_CLI_OUT.search(out)
 
     def test_stats_command(self, tmp_path, monkeypatch, capsys):
         monkeypatch.setattr("src.research_analyzer.DB_PATH", tmp_path / "ra2.db")